@@ -6,35 +6,43 @@ Provides a clean command-line interface with validation and better organization.
 
 import argparse
 import sys
+from functools import lru_cache
 from typing import Optional
 
 from server.config import (
     ServerConfig, ConfigurationManager, LogLevel, LogFormat,
     TimingControls, FeatureFlags, LoggingConfig, CommandConfig
 )
-from server.echo_server import EchoServer
-from server.utils.network_utils import NetworkUtils
 
+# Computed once so parser construction avoids re-iterating the enums
+_LOG_LEVEL_CHOICES = tuple(level.value for level in LogLevel)
+_LOG_FORMAT_CHOICES = tuple(fmt.value for fmt in LogFormat)
 
-def create_argument_parser() -> argparse.ArgumentParser:
-    """Create and configure the argument parser."""
-    parser = argparse.ArgumentParser(
-        description="Start an HTTP Echo Server with comprehensive features",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_HELP_EPILOG = """
 Examples:
   # Basic usage
   python run_server.py
-  
-  # Custom host and port  
+
+  # Custom host and port
   python run_server.py --host 0.0.0.0 --port 8080
-  
+
   # Structured logging with timing limits
   python run_server.py --log-format object --max-delay 30000
-  
+
   # Disable certain features for security
   python run_server.py --disable-file-ops --disable-host-info
         """
+
+_VERSION_STRING = 'Echo Server 2.0.0 (Refactored)'
+
+
+@lru_cache(maxsize=1)
+def create_argument_parser() -> argparse.ArgumentParser:
+    """Create and configure the argument parser."""
+    parser = argparse.ArgumentParser(
+        description="Start an HTTP Echo Server with comprehensive features",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_HELP_EPILOG
     )
     
     # Server configuration
@@ -51,6 +59,10 @@ Examples:
         '--enable-http2', action='store_true',
         help='Enable HTTP/2 support (requires hypercorn)'
     )
+    server_group.add_argument(
+        '--workers', type=int, default=1,
+        help='Number of worker processes (default: 1)'
+    )
     
     # Timing controls
     timing_group = parser.add_argument_group('Timing Controls')
@@ -67,12 +79,12 @@ Examples:
     logging_group = parser.add_argument_group('Logging Configuration')
     logging_group.add_argument(
         '--log-level', type=str, default='debug',
-        choices=[level.value for level in LogLevel],
+        choices=_LOG_LEVEL_CHOICES,
         help='Log level (default: debug)'
     )
     logging_group.add_argument(
         '--log-format', type=str, default='default',
-        choices=[fmt.value for fmt in LogFormat],
+        choices=_LOG_FORMAT_CHOICES,
         help='Log format (default: default)'
     )
     logging_group.add_argument(
@@ -125,22 +137,33 @@ Examples:
         help='Show current configuration and exit'
     )
     parser.add_argument(
-        '--version', action='version', version='Echo Server 2.0.0 (Refactored)'
+        '--version', action='version', version=_VERSION_STRING
     )
     
     return parser
 
 
-def validate_args(args, network_utils: NetworkUtils) -> None:
+@lru_cache(maxsize=256)
+def _is_valid_host(host: str) -> bool:
+    """Validate a host string, caching results across repeated calls."""
+    from server.utils.network_utils import NetworkUtils
+    return NetworkUtils.is_valid_host(host)
+
+
+def validate_args(args) -> None:
     """Validate parsed arguments."""
     # Validate host
-    if not network_utils.is_valid_host(args.host):
+    if not _is_valid_host(args.host):
         raise ValueError(f"Invalid host: {args.host}")
-    
-    # Validate port
-    if not network_utils.is_valid_port(args.port):
+
+    # Validate port (inline range check; no NetworkUtils instance needed)
+    if not 1 <= args.port <= 65535:
         raise ValueError(f"Invalid port: {args.port}. Must be between 1 and 65535.")
     
+    # Validate workers
+    if args.workers < 1:
+        raise ValueError("Workers must be at least 1")
+
     # Validate timing
     if args.min_delay < 0:
         raise ValueError("Minimum delay cannot be negative")
@@ -161,7 +184,8 @@ def create_config_from_args(args) -> ServerConfig:
     config.host = args.host
     config.port = args.port
     config.enable_http2 = args.enable_http2
-    
+    config.workers = args.workers
+
     # Timing configuration
     config.timing = TimingControls(
         min_delay_ms=args.min_delay,
@@ -191,64 +215,80 @@ def create_config_from_args(args) -> ServerConfig:
     return config
 
 
+_RULE = "═" * 60
+_MARK = {True: '✓', False: '✗'}
+
+
 def print_configuration(config: ServerConfig) -> None:
     """Print current configuration in a readable format."""
-    print("═" * 60)
-    print("Echo Server Configuration")
-    print("═" * 60)
-    
-    print(f"Server:")
-    print(f"  Host: {config.host}")
-    print(f"  Port: {config.port}")
     protocol = "HTTP/2" if config.enable_http2 else "HTTP/1.1"
-    print(f"  Protocol: {protocol}")
-    print(f"  URL: http://{config.host}:{config.port}")
-    print(f"  Instance ID: {config.instance_id}")
-    
-    print(f"\nLogging:")
-    print(f"  Level: {config.logging.level.value}")
-    print(f"  Format: {config.logging.format.value}")
-    print(f"  App Name: {config.logging.app_name}")
-    
-    print(f"\nTiming:")
-    print(f"  Min Delay: {config.timing.min_delay_ms}ms")
-    print(f"  Max Delay: {config.timing.max_delay_ms}ms")
-    
-    print(f"\nFeatures:")
-    print(f"  Logging: {'✓' if config.features.enable_logs else '✗'}")
-    print(f"  Host Info: {'✓' if config.features.enable_host else '✗'}")
-    print(f"  HTTP Info: {'✓' if config.features.enable_http else '✗'}")
-    print(f"  Request Info: {'✓' if config.features.enable_request else '✗'}")
-    print(f"  Cookies: {'✓' if config.features.enable_cookies else '✗'}")
-    print(f"  File Ops: {'✓' if config.features.enable_file else '✗'}")
-    print(f"  Custom Headers: {'✓' if config.features.enable_header else '✗'}")
-    print(f"  Environment Vars: {'✓' if config.features.enable_env else '✗'}")
-    
-    print(f"\nCustom Commands:")
-    print(f"  Body Query: ?{config.commands.http_body_query}=value")
-    print(f"  Body Header: {config.commands.http_body_header}: value")
-    print(f"  Code Query: ?{config.commands.http_code_query}=200-404-500")
-    print(f"  Code Header: {config.commands.http_code_header}: 404")
-    print(f"  Time Query: ?{config.commands.time_query}=5000")
-    print(f"  Time Header: {config.commands.time_header}: 5000")
-    
-    if config.features.enable_file:
-        print(f"  File Query: ?{config.commands.file_query}=/path")
-        print(f"  File Header: {config.commands.file_header}: /path")
-    
-    print("═" * 60)
+    features = config.features
+    commands = config.commands
+
+    # Build the whole report first and emit it with a single write, rather
+    # than one locked stdout write per line
+    lines = [
+        _RULE,
+        "Echo Server Configuration",
+        _RULE,
+        "Server:",
+        f"  Host: {config.host}",
+        f"  Port: {config.port}",
+        f"  Protocol: {protocol}",
+        f"  Workers: {config.workers}",
+        f"  URL: http://{config.host}:{config.port}",
+        f"  Instance ID: {config.instance_id}",
+        "",
+        "Logging:",
+        f"  Level: {config.logging.level.value}",
+        f"  Format: {config.logging.format.value}",
+        f"  App Name: {config.logging.app_name}",
+        "",
+        "Timing:",
+        f"  Min Delay: {config.timing.min_delay_ms}ms",
+        f"  Max Delay: {config.timing.max_delay_ms}ms",
+        "",
+        "Features:",
+        f"  Logging: {_MARK[features.enable_logs]}",
+        f"  Host Info: {_MARK[features.enable_host]}",
+        f"  HTTP Info: {_MARK[features.enable_http]}",
+        f"  Request Info: {_MARK[features.enable_request]}",
+        f"  Cookies: {_MARK[features.enable_cookies]}",
+        f"  File Ops: {_MARK[features.enable_file]}",
+        f"  Custom Headers: {_MARK[features.enable_header]}",
+        f"  Environment Vars: {_MARK[features.enable_env]}",
+        "",
+        "Custom Commands:",
+        f"  Body Query: ?{commands.http_body_query}=value",
+        f"  Body Header: {commands.http_body_header}: value",
+        f"  Code Query: ?{commands.http_code_query}=200-404-500",
+        f"  Code Header: {commands.http_code_header}: 404",
+        f"  Time Query: ?{commands.time_query}=5000",
+        f"  Time Header: {commands.time_header}: 5000",
+    ]
+
+    if features.enable_file:
+        lines.append(f"  File Query: ?{commands.file_query}=/path")
+        lines.append(f"  File Header: {commands.file_header}: /path")
+
+    lines.append(_RULE)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main() -> None:
     """Main entry point for the CLI."""
+    # Fast path: answer --version without constructing the full parser
+    if len(sys.argv) == 2 and sys.argv[1] == '--version':
+        print(_VERSION_STRING)
+        return
+
     try:
         # Parse command line arguments
         parser = create_argument_parser()
         args = parser.parse_args()
         
         # Validate arguments
-        network_utils = NetworkUtils()
-        validate_args(args, network_utils)
+        validate_args(args)
         
         # Create configuration
         config = create_config_from_args(args)
@@ -266,7 +306,8 @@ def main() -> None:
         print_configuration(config)
         print("\nStarting server...")
         
-        # Start server
+        # Start server (imported here so config-only paths skip the server stack)
+        from server.echo_server import EchoServer
         server = EchoServer(config)
         server.start()
         
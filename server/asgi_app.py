@@ -5,15 +5,57 @@ This module provides an ASGI-compatible interface for the echo server,
 enabling HTTP/2 support via hypercorn.
 """
 
+import sys
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional, Any
 import json
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import ParseResult, parse_qs
 
 from .config import get_config
 from .response_handlers import ResponseManager, StatusCodeManager, HeaderManager
+from .utils.ci_dict import CaseInsensitiveDict
 from .utils.timing_utils import TimingManager
 from .utils.logging_utils import RequestLogger
 
+# Use orjson for serialization when it is installed; it returns bytes
+# directly and is several times faster than the stdlib encoder
+try:
+    import orjson
+
+    def _dumps_bytes(obj: Any) -> bytes:
+        """Serialize obj to JSON bytes via orjson."""
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps_bytes(obj: Any) -> bytes:
+        """Serialize obj to JSON bytes via the stdlib json module."""
+        return json.dumps(obj).encode("utf-8")
+
+@lru_cache(maxsize=256)
+def _canonical_header_name(name: str) -> str:
+    """
+    Convert a lowercased ASGI header name to canonical HTTP casing.
+
+    ASGI servers lowercase header names per spec; echoed headers should
+    still read like HTTP/1.1 (e.g. 'content-type' -> 'Content-Type').
+    """
+    return name.title()
+
+
+# Constant response fragments, serialized once at import time
+_UNSUPPORTED_BODY = b'{"error": "Only HTTP requests are supported"}'
+_UNSUPPORTED_HEADERS = [(b"content-type", b"application/json")]
+
+# Pre-serialized error bodies for the statuses the app actually sends
+_ERROR_BODIES = {
+    (status, message): _dumps_bytes(
+        {"error": {"code": status, "message": message}}
+    )
+    for status, message in (
+        (400, "Bad Request"),
+        (500, "Internal Server Error"),
+    )
+}
+
 
 class ASGIEchoApp:
     """
@@ -21,7 +63,7 @@ class ASGIEchoApp:
     
     This allows the echo server to run with HTTP/2 support via hypercorn.
     """
-    
+
     def __init__(self):
         """Initialize ASGI application with configuration."""
         self.config = get_config()
@@ -30,6 +72,25 @@ class ASGIEchoApp:
         self.header_manager = HeaderManager(self.config)
         self.timing_manager = TimingManager(self.config)
         self.request_logger = RequestLogger(self.config)
+
+        # Command header names the managers care about; extracting just these
+        # per request keeps the managers from re-scanning every request
+        # header. Interned to match the managers' interned lookup keys.
+        commands = self.config.commands
+        self._cmd_header_names = frozenset({
+            sys.intern(commands.http_body_header.lower()),
+            sys.intern(commands.http_env_body_header.lower()),
+            sys.intern(commands.http_code_header.lower()),
+            sys.intern(commands.http_seed_header.lower()),
+            sys.intern(commands.http_headers_header.lower()),
+            sys.intern(commands.time_header.lower()),
+            sys.intern(commands.file_header.lower()),
+        })
+
+        # Constant response header bytes, encoded once instead of per request
+        self._server_header = (b"server", self.config.logging.app_name.encode("ascii"))
+        self._default_ct_header = (b"content-type", b"application/json")
+        self._json_ct_headers = [self._default_ct_header]
     
     async def __call__(self, scope: Dict[str, Any], receive, send) -> None:
         """
@@ -45,11 +106,11 @@ class ASGIEchoApp:
             await send({
                 "type": "http.response.start",
                 "status": 400,
-                "headers": [[b"content-type", b"application/json"]],
+                "headers": _UNSUPPORTED_HEADERS,
             })
             await send({
                 "type": "http.response.body",
-                "body": json.dumps({"error": "Only HTTP requests are supported"}).encode(),
+                "body": _UNSUPPORTED_BODY,
             })
             return
         
@@ -65,60 +126,80 @@ class ASGIEchoApp:
         method = scope["method"]
         path = scope["path"]
         query_string = scope.get("query_string", b"").decode("utf-8")
-        headers_dict = {name.decode().lower(): value.decode() for name, value in scope.get("headers", [])}
+
+        # Single-pass decode: header names are ASCII per the HTTP spec and
+        # latin-1 maps bytes 1:1, so neither needs UTF-8 validation. ASGI
+        # names arrive lowercased; restore canonical casing for the echoed
+        # mapping (case-insensitive, so strategy lookups stay single-probe)
+        # and pick out the command subset for the managers as we go.
+        headers_dict = CaseInsensitiveDict()
+        cmd_headers = {}
+        cmd_names = self._cmd_header_names
+        for raw_name, raw_value in scope.get("headers") or ():
+            name = raw_name.decode("ascii")
+            value = raw_value.decode("latin-1")
+            headers_dict[_canonical_header_name(name)] = value
+            if name in cmd_names:
+                cmd_headers[name] = value
         
-        # Parse query parameters
-        parsed_path = urlparse(path)
-        query_params = parse_qs(parsed_path.query)
+        # The ASGI scope already splits path and query string, so parse the
+        # query directly and assemble a ParseResult without re-parsing the URL.
+        query_params = parse_qs(query_string)
+        parsed_path = ParseResult(
+            scheme="", netloc="", path=path, params="",
+            query=query_string, fragment=""
+        )
         
         # Read request body
         body = await self._read_body(receive)
         
-        # Get client address
-        client_address = (scope.get("client", ["unknown"])[0], scope.get("client", [0, 0])[1])
-        
-        # Add method to headers for response handlers
-        headers_dict['REQUEST_METHOD'] = method
-        
-        # Apply timing delay if requested
-        self.timing_manager.apply_delay(headers_dict, query_params)
+        # Get client address with a single scope lookup
+        client = scope.get("client")
+        client_address = ("unknown", 0) if client is None else (client[0], client[1])
         
+        # Apply timing delay if requested; awaiting keeps the event loop free
+        # for other connections instead of blocking a worker thread
+        await self.timing_manager.apply_delay_async(cmd_headers, query_params)
+
         # Determine response status code
-        status_code = self.status_manager.get_status_code(headers_dict, query_params)
+        status_code = self.status_manager.get_status_code(cmd_headers, query_params)
         
         # Generate response content
         response_content = self.response_manager.generate_response(
-            headers_dict, query_params, parsed_path, body, client_address
+            headers_dict, query_params, parsed_path, body, client_address, method
         )
         
-        # Get custom headers
-        custom_headers = self.header_manager.get_custom_headers(headers_dict, query_params)
-        
-        # Prepare response headers
-        response_headers: List[Tuple[bytes, bytes]] = []
-        
-        # Add custom headers
-        for header_name, header_value in custom_headers:
-            response_headers.append((header_name.encode(), header_value.encode()))
-        
-        # Add default content type if no custom headers were added
-        if not custom_headers:
-            response_headers.append((b"content-type", b"application/json"))
-        
+        # Get custom headers already encoded as (bytes, bytes) pairs; default
+        # the content type when no custom headers were requested
+        custom_headers = self.header_manager.get_custom_headers_bytes(
+            cmd_headers, query_params
+        )
+        response_headers: List[Tuple[bytes, bytes]] = (
+            list(custom_headers) if custom_headers else [self._default_ct_header]
+        )
+
         # Add server header
-        response_headers.append((b"server", self.config.logging.app_name.encode()))
+        response_headers.append(self._server_header)
         
-        # Send response
-        await send({
+        # Strategies that already produced bytes skip the re-encode entirely
+        if isinstance(response_content, bytes):
+            response_body = response_content
+        else:
+            response_body = response_content.encode("utf-8")
+
+        # Send response; the payload dicts are assembled up front so both
+        # messages are ready before the first await yields control
+        start_message = {
             "type": "http.response.start",
             "status": status_code,
             "headers": response_headers,
-        })
-        
-        await send({
+        }
+        body_message = {
             "type": "http.response.body",
-            "body": response_content.encode("utf-8"),
-        })
+            "body": response_body,
+        }
+        await send(start_message)
+        await send(body_message)
         
         # Log request
         self.request_logger.log_request(
@@ -126,52 +207,55 @@ class ASGIEchoApp:
             client_address[0], headers_dict, query_params, body
         )
     
-    async def _read_body(self, receive) -> str:
-        """Read request body from ASGI receive callable."""
-        body_parts: List[bytes] = []
-        
+    async def _read_body(self, receive) -> bytes:
+        """Read request body from ASGI receive callable as raw bytes."""
+        # Limit body size for security (10MB max); reject as soon as the
+        # limit is crossed instead of buffering the whole upload first.
+        max_body_size = 10 * 1024 * 1024
+        body = bytearray()
+
         while True:
             message = await receive()
             if message["type"] == "http.request":
-                body_parts.append(message.get("body", b""))
+                chunk = message.get("body", b"")
+                if len(body) + len(chunk) > max_body_size:
+                    self.request_logger.log_warning(
+                        f"Request body too large: over {max_body_size} bytes"
+                    )
+                    # Drain the remaining chunks without storing them
+                    if message.get("more_body", False):
+                        while True:
+                            message = await receive()
+                            if (message["type"] != "http.request" or
+                                    not message.get("more_body", False)):
+                                break
+                    return b""
+                body.extend(chunk)
                 if not message.get("more_body", False):
                     break
             elif message["type"] == "http.disconnect":
                 break
-        
-        body_bytes = b"".join(body_parts)
-        
-        # Limit body size for security (10MB max)
-        max_body_size = 10 * 1024 * 1024
-        if len(body_bytes) > max_body_size:
-            self.request_logger.log_warning(
-                f"Request body too large: {len(body_bytes)} bytes"
-            )
-            return ""
-        
-        try:
-            return body_bytes.decode("utf-8", errors="replace")
-        except UnicodeDecodeError as e:
-            self.request_logger.log_error("Error decoding request body", e)
-            return ""
+
+        # Decoding is deferred to the JSON echo branch, so bodies that are
+        # never rendered as text skip the str round trip entirely
+        return bytes(body)
     
     async def _send_error_response(self, status_code: int, message: str, send) -> None:
         """Send error response."""
-        error_response = {
-            "error": {
-                "code": status_code,
-                "message": message
-            }
-        }
-        
+        body = _ERROR_BODIES.get((status_code, message))
+        if body is None:
+            body = _dumps_bytes(
+                {"error": {"code": status_code, "message": message}}
+            )
+
         await send({
             "type": "http.response.start",
             "status": status_code,
-            "headers": [[b"content-type", b"application/json"]],
+            "headers": self._json_ct_headers,
         })
-        
+
         await send({
             "type": "http.response.body",
-            "body": json.dumps(error_response).encode("utf-8"),
+            "body": body,
         })
 
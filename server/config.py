@@ -6,9 +6,8 @@ type safety, and environment variable support.
 """
 
 import os
-import logging
-import uuid
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from enum import Enum
 
@@ -28,7 +27,12 @@ class LogLevel(Enum):
     ERROR = "error"
 
 
-@dataclass
+# Value -> member lookup tables so env parsing avoids scanning enum members
+_LOG_FORMAT_BY_VALUE = {fmt.value: fmt for fmt in LogFormat}
+_LOG_LEVEL_BY_VALUE = {level.value: level for level in LogLevel}
+
+
+@dataclass(frozen=True)
 class CommandConfig:
     """Configuration for custom command names."""
     http_body_query: str = "echo_body"
@@ -37,6 +41,8 @@ class CommandConfig:
     http_env_body_header: str = "x-echo-env-body"
     http_code_query: str = "echo_code"
     http_code_header: str = "x-echo-code"
+    http_seed_query: str = "echo_seed"
+    http_seed_header: str = "x-echo-seed"
     http_headers_query: str = "echo_header"
     http_headers_header: str = "x-echo-header"
     time_query: str = "echo_time"
@@ -45,7 +51,7 @@ class CommandConfig:
     file_header: str = "x-echo-file"
 
 
-@dataclass
+@dataclass(frozen=True)
 class TimingControls:
     """Configuration for timing controls and validation."""
     min_delay_ms: int = 0
@@ -61,7 +67,7 @@ class TimingControls:
             raise ValueError("Maximum delay cannot exceed 5 minutes (300000ms)")
 
 
-@dataclass
+@dataclass(frozen=True)
 class FeatureFlags:
     """Feature toggle configuration."""
     enable_logs: bool = True
@@ -74,7 +80,7 @@ class FeatureFlags:
     enable_env: bool = False  # Environment variables in response (security sensitive)
 
 
-@dataclass
+@dataclass(frozen=True)
 class LoggingConfig:
     """Logging configuration."""
     app_name: str = "echoserver"
@@ -83,6 +89,9 @@ class LoggingConfig:
     
     def get_logging_level(self) -> int:
         """Convert LogLevel enum to logging module constant."""
+        # Imported lazily so config-only code paths avoid pulling in logging
+        import logging
+
         level_mapping = {
             LogLevel.DEBUG: logging.DEBUG,
             LogLevel.INFO: logging.INFO,
@@ -94,6 +103,9 @@ class LoggingConfig:
 
 def _generate_instance_id() -> str:
     """Generate a unique instance ID for the server."""
+    # uuid is only needed once a ServerConfig is actually created
+    import uuid
+
     return str(uuid.uuid4())
 
 
@@ -103,18 +115,28 @@ class ServerConfig:
     host: str = "127.0.0.1"
     port: int = 80
     enable_http2: bool = False
-    instance_id: str = field(default_factory=_generate_instance_id)  # Unique UUID for this server instance
+    workers: int = 1  # Prefork worker processes sharing the listening socket
     commands: CommandConfig = field(default_factory=CommandConfig)
     timing: TimingControls = field(default_factory=TimingControls)
     features: FeatureFlags = field(default_factory=FeatureFlags)
     logging: LoggingConfig = field(default_factory=LoggingConfig)
-    
+    _instance_id: Optional[str] = field(default=None, repr=False)
+
     def __post_init__(self):
         """Validate server configuration."""
         if not (1 <= self.port <= 65535):
             raise ValueError(f"Port must be between 1 and 65535, got {self.port}")
         if not self.host.strip():
             raise ValueError("Host cannot be empty")
+        if self.workers < 1:
+            raise ValueError(f"Workers must be at least 1, got {self.workers}")
+
+    @property
+    def instance_id(self) -> str:
+        """Unique UUID for this server instance, generated on first access."""
+        if self._instance_id is None:
+            self._instance_id = _generate_instance_id()
+        return self._instance_id
 
 
 class ConfigurationManager:
@@ -124,7 +146,13 @@ class ConfigurationManager:
     
     @classmethod
     def from_environment(cls) -> ServerConfig:
-        """Load configuration from environment variables."""
+        """Load configuration from environment variables (cached per process)."""
+        return cls._from_environment_cached()
+
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _from_environment_cached(cls) -> ServerConfig:
+        """Parse the environment into a ServerConfig exactly once."""
         def get_env_bool(key: str, default: bool) -> bool:
             """Get boolean value from environment variable."""
             value = os.getenv(key, str(default)).lower()
@@ -137,18 +165,15 @@ class ConfigurationManager:
             except ValueError:
                 return default
         
-        def get_env_enum(key: str, enum_class, default):
-            """Get enum value from environment variable."""
-            value = os.getenv(key, default.value).lower()
-            for enum_val in enum_class:
-                if enum_val.value == value:
-                    return enum_val
-            return default
+        def get_env_enum(key: str, lookup, default):
+            """Get enum value from environment variable via a value lookup table."""
+            return lookup.get(os.getenv(key, default.value).lower(), default)
         
         # Server configuration
         host = os.getenv('HOST', '127.0.0.1')
         port = get_env_int('PORT', 80)
         enable_http2 = get_env_bool('ENABLE_HTTP2', False)
+        workers = get_env_int('WORKERS', 1)
         
         # Command configuration
         commands = CommandConfig(
@@ -158,6 +183,8 @@ class ConfigurationManager:
             http_env_body_header=os.getenv('COMMANDS__HTTPENVBODY__HEADER', 'x-echo-env-body'),
             http_code_query=os.getenv('COMMANDS__HTTPCODE__QUERY', 'echo_code'),
             http_code_header=os.getenv('COMMANDS__HTTPCODE__HEADER', 'x-echo-code'),
+            http_seed_query=os.getenv('COMMANDS__HTTPSEED__QUERY', 'echo_seed'),
+            http_seed_header=os.getenv('COMMANDS__HTTPSEED__HEADER', 'x-echo-seed'),
             http_headers_query=os.getenv('COMMANDS__HTTPHEADERS__QUERY', 'echo_header'),
             http_headers_header=os.getenv('COMMANDS__HTTPHEADERS__HEADER', 'x-echo-header'),
             time_query=os.getenv('COMMANDS__TIME__QUERY', 'echo_time'),
@@ -187,14 +214,15 @@ class ConfigurationManager:
         # Logging configuration
         logging_config = LoggingConfig(
             app_name=os.getenv('LOGS__APP', 'echoserver'),
-            level=get_env_enum('LOGS__LEVEL', LogLevel, LogLevel.DEBUG),
-            format=get_env_enum('LOGS__FORMAT', LogFormat, LogFormat.DEFAULT),
+            level=get_env_enum('LOGS__LEVEL', _LOG_LEVEL_BY_VALUE, LogLevel.DEBUG),
+            format=get_env_enum('LOGS__FORMAT', _LOG_FORMAT_BY_VALUE, LogFormat.DEFAULT),
         )
         
         return ServerConfig(
             host=host,
             port=port,
             enable_http2=enable_http2,
+            workers=workers,
             commands=commands,
             timing=timing,
             features=features,
@@ -209,22 +237,28 @@ class ConfigurationManager:
         if hasattr(args, 'port') and args.port:
             config.port = args.port
             
-        # Update timing controls
+        # Update timing controls (frozen dataclass: build a replacement)
+        timing_updates = {}
         timing_args = getattr(args, 'controls_times_min', None)
         if timing_args is not None:
-            config.timing.min_delay_ms = timing_args
+            timing_updates['min_delay_ms'] = timing_args
         timing_args = getattr(args, 'controls_times_max', None)
         if timing_args is not None:
-            config.timing.max_delay_ms = timing_args
-            
+            timing_updates['max_delay_ms'] = timing_args
+        if timing_updates:
+            config.timing = replace(config.timing, **timing_updates)
+
         # Update logging
+        logging_updates = {}
         if hasattr(args, 'logs_level') and args.logs_level:
-            config.logging.level = LogLevel(args.logs_level)
+            logging_updates['level'] = LogLevel(args.logs_level)
         if hasattr(args, 'logs_format') and args.logs_format:
-            config.logging.format = LogFormat(args.logs_format)
+            logging_updates['format'] = LogFormat(args.logs_format)
         if hasattr(args, 'logs_app') and args.logs_app:
-            config.logging.app_name = args.logs_app
-            
+            logging_updates['app_name'] = args.logs_app
+        if logging_updates:
+            config.logging = replace(config.logging, **logging_updates)
+
         # Update feature flags
         feature_mappings = {
             'disable_logs': ('enable_logs', False),
@@ -235,24 +269,37 @@ class ConfigurationManager:
             'disable_file': ('enable_file', False),
             'disable_header': ('enable_header', False),
         }
-        
+
+        feature_updates = {}
         for arg_name, (feature_name, value) in feature_mappings.items():
             if hasattr(args, arg_name) and getattr(args, arg_name):
-                setattr(config.features, feature_name, value)
-                
+                feature_updates[feature_name] = value
+        if feature_updates:
+            config.features = replace(config.features, **feature_updates)
+
         return config
 
 
-# Global configuration instance
+# Explicitly set configuration instance (overrides the environment default)
 _config: Optional[ServerConfig] = None
 
 
+@lru_cache(maxsize=1)
+def _default_config() -> ServerConfig:
+    """Build the environment-based default config exactly once.
+
+    lru_cache's internal lock makes the first construction atomic, so
+    concurrent first callers cannot race and build two configs.
+    """
+    return ConfigurationManager.from_environment()
+
+
 def get_config() -> ServerConfig:
     """Get the global configuration instance."""
-    global _config
-    if _config is None:
-        _config = ConfigurationManager.from_environment()
-    return _config
+    config = _config
+    if config is not None:
+        return config
+    return _default_config()
 
 
 def set_config(config: ServerConfig) -> None:
@@ -264,5 +311,7 @@ def set_config(config: ServerConfig) -> None:
 def reload_config() -> ServerConfig:
     """Reload configuration from environment variables."""
     global _config
-    _config = ConfigurationManager.from_environment()
-    return _config
+    _config = None
+    _default_config.cache_clear()
+    ConfigurationManager._from_environment_cached.cache_clear()
+    return get_config()
@@ -8,14 +8,111 @@ based on the request parameters and headers.
 import os
 import json
 import random
+import re
+import sys
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple, Union
 from urllib.parse import ParseResult
 
 from .config import ServerConfig
 from .utils.file_utils import FileManager
 from .utils.network_utils import NetworkUtils
 
+# Serialize with orjson when installed: it emits bytes directly (skipping
+# the downstream str->bytes encode) and is several times faster than the
+# stdlib encoder
+try:
+    import orjson
+
+    def _dumps(obj: Any, pretty: bool = False) -> bytes:
+        """Serialize obj to JSON bytes via orjson."""
+        if pretty:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj: Any, pretty: bool = False) -> bytes:
+        """Serialize obj to JSON bytes via the stdlib json module."""
+        if pretty:
+            return json.dumps(obj, indent=2).encode('utf-8')
+        return json.dumps(obj).encode('utf-8')
+
+
+@dataclass(frozen=True)
+class _CommandKeys:
+    """Lowercased header name and query name for one echo command.
+
+    Built once per strategy/manager so request handling probes fixed
+    attributes instead of re-lowercasing config values on every call.
+    """
+    header: str
+    query: str
+
+    def __post_init__(self):
+        """Intern both keys so dict probes can hit pointer equality."""
+        object.__setattr__(self, 'header', sys.intern(self.header))
+        object.__setattr__(self, 'query', sys.intern(self.query))
+
+
+def _find_header_value(headers: Dict[str, str], lowered_name: str) -> Optional[str]:
+    """
+    Case-insensitive header lookup without rebuilding the mapping.
+
+    Pre-lowered mappings (the ASGI command subset) and email.Message views
+    hit the direct get(); for plain dicts with mixed casing a single scan
+    replaces the old per-call {k.lower(): v} rebuild.
+    """
+    value = headers.get(lowered_name)
+    if value is not None:
+        return value
+    for name, val in headers.items():
+        if name.lower() == lowered_name:
+            return val
+    return None
+
+
+def _command_value(keys: _CommandKeys, headers: Dict[str, str],
+                   query: Dict[str, List[str]]) -> Optional[str]:
+    """Extract a command value from headers (preferred) or query parameters."""
+    value = _find_header_value(headers, keys.header)
+    if value is not None:
+        return value
+    values = query.get(keys.query)
+    if values:
+        return values[0]
+    return None
+
+
+# Comma followed by word characters and equals (likely start of a new
+# cookie); compiled once instead of per Set-Cookie parse
+_COOKIE_SPLIT_RE = re.compile(r',\s*(?=[a-zA-Z_][a-zA-Z0-9_]*=)')
+
+
+def _flatten_query(query: Dict[str, List[str]]) -> Dict[str, Any]:
+    """
+    Collapse single-item parse_qs value lists to scalars for presentation.
+
+    The empty dict fast path skips the comprehension entirely, which is the
+    common case for echo traffic with no query string.
+    """
+    if not query:
+        return {}
+    return {k: v[0] if len(v) == 1 else v for k, v in query.items()}
+
+
+@lru_cache(maxsize=256)
+def _envget(name: str) -> bytes:
+    """
+    Cached, pre-encoded os.getenv for the env-body command.
+
+    The process environment does not change while the server runs, so
+    repeated requests for the same variable skip both the environ lookup
+    and the response encode.
+    """
+    return os.getenv(name, '').encode('utf-8')
+
 
 class ResponseStrategy(ABC):
     """Abstract base class for response strategies."""
@@ -30,56 +127,57 @@ class ResponseStrategy(ABC):
     
     @abstractmethod
     def generate_response(self, headers: Dict[str, str], query: Dict[str, List[str]], 
-                         parsed_path: ParseResult, body: str, client_address: tuple) -> str:
+                         parsed_path: ParseResult, body: bytes, client_address: tuple,
+                         method: str = "GET") -> Union[str, bytes]:
         """Generate the response content."""
         pass
 
 
 class CustomBodyStrategy(ResponseStrategy):
     """Handle custom body responses from headers or query parameters."""
-    
+
+    def __init__(self, config: ServerConfig):
+        super().__init__(config)
+        self._keys = _CommandKeys(
+            header=config.commands.http_body_header.lower(),
+            query=config.commands.http_body_query,
+        )
+
     def can_handle(self, headers: Dict[str, str], query: Dict[str, List[str]]) -> bool:
         """Check if custom body is requested."""
-        # Check headers case-insensitively
-        headers_lower = {k.lower(): v for k, v in headers.items()}
-        return (self.config.commands.http_body_header.lower() in headers_lower or 
-                self.config.commands.http_body_query in query)
-    
-    def generate_response(self, headers: Dict[str, str], query: Dict[str, List[str]], 
-                         parsed_path: ParseResult, body: str, client_address: tuple) -> str:
-        """Return the custom body content."""
-        # Check headers case-insensitively
-        headers_lower = {k.lower(): v for k, v in headers.items()}
-        if self.config.commands.http_body_header.lower() in headers_lower:
-            return headers_lower[self.config.commands.http_body_header.lower()]
-        elif self.config.commands.http_body_query in query:
-            return query[self.config.commands.http_body_query][0]
-        return ""
+        return _command_value(self._keys, headers, query) is not None
+
+    def generate_response(self, headers: Dict[str, str], query: Dict[str, List[str]],
+                         parsed_path: ParseResult, body: bytes, client_address: tuple,
+                         method: str = "GET") -> Union[str, bytes]:
+        """Return the custom body content, encoded once for the wire."""
+        value = _command_value(self._keys, headers, query)
+        return value.encode('utf-8') if value is not None else b""
 
 
 class EnvironmentBodyStrategy(ResponseStrategy):
     """Handle environment variable body responses."""
-    
+
+    def __init__(self, config: ServerConfig):
+        super().__init__(config)
+        self._keys = _CommandKeys(
+            header=config.commands.http_env_body_header.lower(),
+            query=config.commands.http_env_body_query,
+        )
+
     def can_handle(self, headers: Dict[str, str], query: Dict[str, List[str]]) -> bool:
         """Check if environment variable body is requested."""
-        headers_lower = {k.lower(): v for k, v in headers.items()}
-        return (self.config.commands.http_env_body_header.lower() in headers_lower or 
-                self.config.commands.http_env_body_query in query)
-    
-    def generate_response(self, headers: Dict[str, str], query: Dict[str, List[str]], 
-                         parsed_path: ParseResult, body: str, client_address: tuple) -> str:
+        return _command_value(self._keys, headers, query) is not None
+
+    def generate_response(self, headers: Dict[str, str], query: Dict[str, List[str]],
+                         parsed_path: ParseResult, body: bytes, client_address: tuple,
+                         method: str = "GET") -> Union[str, bytes]:
         """Return environment variable content."""
-        env_var_name = None
-        headers_lower = {k.lower(): v for k, v in headers.items()}
-        
-        if self.config.commands.http_env_body_header.lower() in headers_lower:
-            env_var_name = headers_lower[self.config.commands.http_env_body_header.lower()]
-        elif self.config.commands.http_env_body_query in query:
-            env_var_name = query[self.config.commands.http_env_body_query][0]
-        
+        env_var_name = _command_value(self._keys, headers, query)
+
         if env_var_name:
-            return os.getenv(env_var_name, '')
-        return ""
+            return _envget(env_var_name)
+        return b""
 
 
 class FileOperationStrategy(ResponseStrategy):
@@ -88,29 +186,26 @@ class FileOperationStrategy(ResponseStrategy):
     def __init__(self, config: ServerConfig):
         super().__init__(config)
         self.file_manager = FileManager()
-    
+        self._keys = _CommandKeys(
+            header=config.commands.file_header.lower(),
+            query=config.commands.file_query,
+        )
+
     def can_handle(self, headers: Dict[str, str], query: Dict[str, List[str]]) -> bool:
         """Check if file operation is requested and enabled."""
         if not self.config.features.enable_file:
             return False
-        headers_lower = {k.lower(): v for k, v in headers.items()}
-        return (self.config.commands.file_header.lower() in headers_lower or 
-                self.config.commands.file_query in query)
-    
-    def generate_response(self, headers: Dict[str, str], query: Dict[str, List[str]], 
-                         parsed_path: ParseResult, body: str, client_address: tuple) -> str:
+        return _command_value(self._keys, headers, query) is not None
+
+    def generate_response(self, headers: Dict[str, str], query: Dict[str, List[str]],
+                         parsed_path: ParseResult, body: bytes, client_address: tuple,
+                         method: str = "GET") -> Union[str, bytes]:
         """Return file content or directory listing."""
-        file_path = None
-        headers_lower = {k.lower(): v for k, v in headers.items()}
-        
-        if self.config.commands.file_header.lower() in headers_lower:
-            file_path = headers_lower[self.config.commands.file_header.lower()]
-        elif self.config.commands.file_query in query:
-            file_path = query[self.config.commands.file_query][0]
-        
+        file_path = _command_value(self._keys, headers, query)
+
         if file_path:
             return self.file_manager.read_file_or_directory(file_path)
-        return json.dumps({"error": "No file path specified"})
+        return _dumps({"error": "No file path specified"})
 
 
 class DefaultEchoStrategy(ResponseStrategy):
@@ -119,13 +214,27 @@ class DefaultEchoStrategy(ResponseStrategy):
     def __init__(self, config: ServerConfig):
         super().__init__(config)
         self.network_utils = NetworkUtils()
-    
+        # The process environment is effectively fixed for the server's
+        # lifetime; copying it once here avoids a len(os.environ)-sized
+        # allocation per request when enable_env is on
+        self._env_snapshot = dict(os.environ)
+        # Host info cache: hostname/IPs rarely change, so the socket/DNS
+        # calls behind them are refreshed at most once per minute
+        self._host_info_cache: Optional[Dict[str, Any]] = None
+        self._host_info_ts = 0.0
+
+    def refresh_env(self) -> None:
+        """Re-snapshot os.environ (for tests or deliberate env changes)."""
+        self._env_snapshot = dict(os.environ)
+
+
     def can_handle(self, headers: Dict[str, str], query: Dict[str, List[str]]) -> bool:
         """This strategy handles all requests as fallback."""
         return True
     
     def generate_response(self, headers: Dict[str, str], query: Dict[str, List[str]], 
-                         parsed_path: ParseResult, body: str, client_address: tuple) -> str:
+                         parsed_path: ParseResult, body: bytes, client_address: tuple,
+                         method: str = "GET") -> Union[str, bytes]:
         """Generate comprehensive echo response."""
         response_data = {}
         
@@ -139,7 +248,7 @@ class DefaultEchoStrategy(ResponseStrategy):
         
         # HTTP information
         if self.config.features.enable_http:
-            response_data["http"] = self._build_http_info(headers, parsed_path)
+            response_data["http"] = self._build_http_info(headers, parsed_path, method)
         
         # Request information
         if self.config.features.enable_request:
@@ -149,13 +258,22 @@ class DefaultEchoStrategy(ResponseStrategy):
         
         # Environment information (if enabled)
         if self.config.features.enable_env:
-            response_data["environment"] = dict(os.environ)
+            response_data["environment"] = self._env_snapshot
         
-        return json.dumps(response_data, indent=2)
+        return _dumps(response_data, pretty=True)
     
+    _HOST_INFO_TTL_S = 60.0
+
     def _build_host_info(self) -> Dict[str, Any]:
-        """Build host information section."""
-        return {
+        """Build host information section, cached with a TTL refresh."""
+        now = time.monotonic()
+        cached = self._host_info_cache
+        if cached is not None and now - self._host_info_ts < self._HOST_INFO_TTL_S:
+            # The encoder only reads the dict, so returning the same
+            # reference is safe
+            return cached
+
+        host_info = {
             "hostname": self.network_utils.get_hostname(),
             "ip": self.network_utils.get_primary_ip(),
             "ips": self.network_utils.get_all_ips(),
@@ -165,25 +283,34 @@ class DefaultEchoStrategy(ResponseStrategy):
                 "type": "unknown"
             }
         }
+        self._host_info_cache = host_info
+        self._host_info_ts = now
+        return host_info
     
-    def _build_http_info(self, headers: Dict[str, str], parsed_path: ParseResult) -> Dict[str, Any]:
+    def _build_http_info(self, headers: Dict[str, str], parsed_path: ParseResult,
+                         method: str) -> Dict[str, Any]:
         """Build HTTP information section."""
         host_header = headers.get('Host', 'localhost')
         return {
-            "method": headers.get('REQUEST_METHOD', 'GET'),
+            "method": method,
             "baseUrl": f"http://{host_header}",
             "originalUrl": str(parsed_path.geturl()) if hasattr(parsed_path, 'geturl') else parsed_path.path,
             "protocol": "http"
         }
     
-    def _build_request_info(self, headers: Dict[str, str], query: Dict[str, List[str]], 
-                           body: str, client_address: tuple) -> Dict[str, Any]:
+    def _build_request_info(self, headers: Dict[str, str], query: Dict[str, List[str]],
+                           body: bytes, client_address: tuple) -> Dict[str, Any]:
         """Build request information section."""
         request_info = {
             "params": {},
-            "query": {k: v[0] if len(v) == 1 else v for k, v in query.items()},
-            "body": body,
-            "headers": headers,
+            "query": _flatten_query(query),
+            # The body stays raw bytes through the pipeline; it is decoded
+            # only here, at the single point where it becomes JSON text
+            "body": (body.decode('utf-8', errors='replace')
+                     if isinstance(body, (bytes, bytearray)) else body),
+            # Header views (e.g. email.Message) are materialized only here,
+            # where the headers actually get serialized
+            "headers": headers if isinstance(headers, dict) else dict(headers),
             "remoteAddress": client_address[0],
             "remotePort": client_address[1]
         }
@@ -196,12 +323,15 @@ class DefaultEchoStrategy(ResponseStrategy):
     
     def _parse_cookies(self, headers: Dict[str, str]) -> Dict[str, str]:
         """Parse cookies from request headers."""
+        # Both header mappings ('Cookie' via CaseInsensitiveDict on the ASGI
+        # path, email.Message on the threaded one) resolve the name without
+        # regard to the client's casing
         cookies = {}
         cookie_header = headers.get('Cookie', '')
         if cookie_header:
             for cookie in cookie_header.split(';'):
-                if '=' in cookie:
-                    key, value = cookie.strip().split('=', 1)
+                key, sep, value = cookie.strip().partition('=')
+                if sep:
                     cookies[key] = value
         return cookies
 
@@ -217,16 +347,34 @@ class ResponseManager:
             FileOperationStrategy(config),
             DefaultEchoStrategy(config),  # Must be last as fallback
         ]
-    
-    def generate_response(self, headers: Dict[str, str], query: Dict[str, List[str]], 
-                         parsed_path: ParseResult, body: str, client_address: tuple) -> str:
+
+        # Priority-ordered (keys, generate) dispatch table built once, so a
+        # request costs one command-value probe per candidate instead of a
+        # can_handle scan followed by a second extraction. Binding the
+        # generate_response methods here also skips the per-request
+        # attribute/descriptor resolution on the strategy instances. File
+        # operations are left out entirely when the feature is disabled.
+        self._default_strategy = self.strategies[-1]
+        self._default_generate = self._default_strategy.generate_response
+        self._dispatch = tuple(
+            (strategy._keys, strategy.generate_response)
+            for strategy in self.strategies[:-1]
+            if not (isinstance(strategy, FileOperationStrategy)
+                    and not config.features.enable_file)
+        )
+
+    def generate_response(self, headers: Dict[str, str], query: Dict[str, List[str]],
+                         parsed_path: ParseResult, body: bytes, client_address: tuple,
+                         method: str = "GET") -> Union[str, bytes]:
         """Generate response using the first applicable strategy."""
-        for strategy in self.strategies:
-            if strategy.can_handle(headers, query):
-                return strategy.generate_response(headers, query, parsed_path, body, client_address)
-        
-        # Fallback (should never reach here due to DefaultEchoStrategy)
-        return json.dumps({"error": "No suitable response strategy found"})
+        for keys, generate in self._dispatch:
+            if _command_value(keys, headers, query) is not None:
+                return generate(headers, query, parsed_path, body,
+                                client_address, method)
+
+        return self._default_generate(
+            headers, query, parsed_path, body, client_address, method
+        )
 
 
 class StatusCodeManager:
@@ -234,33 +382,59 @@ class StatusCodeManager:
     
     def __init__(self, config: ServerConfig):
         self.config = config
-    
+        self._keys = _CommandKeys(
+            header=config.commands.http_code_header.lower(),
+            query=config.commands.http_code_query,
+        )
+        self._seed_keys = _CommandKeys(
+            header=config.commands.http_seed_header.lower(),
+            query=config.commands.http_seed_query,
+        )
+
     def get_status_code(self, headers: Dict[str, str], query: Dict[str, List[str]]) -> int:
         """Get status code from headers or query parameters."""
         code_str = self._get_code_string(headers, query)
-        return self._parse_status_code(code_str)
-    
+        # The seed only influences multi-code selection, so single-code
+        # requests never pay the extra lookup
+        seed = (_command_value(self._seed_keys, headers, query)
+                if '-' in code_str else None)
+        return self._parse_status_code(code_str, seed)
+
     def _get_code_string(self, headers: Dict[str, str], query: Dict[str, List[str]]) -> str:
         """Extract status code string from headers or query."""
-        headers_lower = {k.lower(): v for k, v in headers.items()}
-        if self.config.commands.http_code_header.lower() in headers_lower:
-            return headers_lower[self.config.commands.http_code_header.lower()]
-        elif self.config.commands.http_code_query in query:
-            return query[self.config.commands.http_code_query][0]
-        return "200"
+        value = _command_value(self._keys, headers, query)
+        return value if value is not None else "200"
     
-    def _parse_status_code(self, code_str: str) -> int:
-        """Parse status code, handling multiple codes with random selection."""
+    def _parse_status_code(self, code_str: str, seed: Optional[str] = None) -> int:
+        """
+        Parse status code, handling multiple codes with random selection.
+
+        When a seed is given, the selection among multiple codes is made
+        with a seeded RNG so callers (and tests) can get a deterministic
+        pick instead of probing the randomness repeatedly.
+        """
+        # Fast path: a single three-digit code (the overwhelmingly common
+        # case) skips the dash scan, split and try/except machinery
+        if len(code_str) == 3 and code_str.isdigit():
+            code = int(code_str)
+            return code if 100 <= code <= 599 else 200
+
         if '-' in code_str:
             try:
-                codes = [int(c.strip()) for c in code_str.split('-')]
+                to_int = int
+                codes = [to_int(c.strip()) for c in code_str.split('-')]
                 # Validate all codes are valid HTTP status codes
                 valid_codes = [code for code in codes if 100 <= code <= 599]
                 if valid_codes:
+                    if seed is not None:
+                        try:
+                            return random.Random(int(seed)).choice(valid_codes)
+                        except ValueError:
+                            pass
                     return random.choice(valid_codes)
             except ValueError:
                 pass
-        
+
         try:
             code = int(code_str)
             if 100 <= code <= 599:
@@ -277,14 +451,16 @@ class HeaderManager:
     
     def __init__(self, config: ServerConfig):
         self.config = config
-    
+        self._keys = _CommandKeys(
+            header=config.commands.http_headers_header.lower(),
+            query=config.commands.http_headers_query,
+        )
+
     def should_add_custom_headers(self, headers: Dict[str, str], query: Dict[str, List[str]]) -> bool:
         """Check if custom headers should be added."""
         if not self.config.features.enable_header:
             return False
-        headers_lower = {k.lower(): v for k, v in headers.items()}
-        return (self.config.commands.http_headers_header.lower() in headers_lower or 
-                self.config.commands.http_headers_query in query)
+        return _command_value(self._keys, headers, query) is not None
     
     def get_custom_headers(self, headers: Dict[str, str], query: Dict[str, List[str]]) -> List[Tuple[str, str]]:
         """Parse and return custom headers to add to response as list of tuples to support duplicates."""
@@ -292,15 +468,29 @@ class HeaderManager:
         if header_string:
             return self._parse_header_string(header_string)
         return []
+
+    def get_custom_headers_bytes(self, headers: Dict[str, str],
+                                 query: Dict[str, List[str]]) -> List[Tuple[bytes, bytes]]:
+        """
+        Return custom headers as (bytes, bytes) pairs for ASGI responses.
+
+        Encoding happens here (with a small cache for repeated pairs) so the
+        ASGI handler can extend its header list without a per-header encode loop.
+        """
+        encode = self._encode_header_pair
+        return [encode(name, value)
+                for name, value in self.get_custom_headers(headers, query)]
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _encode_header_pair(name: str, value: str) -> Tuple[bytes, bytes]:
+        """Encode a header pair once and cache it for repeated request patterns."""
+        return name.encode('ascii'), value.encode()
     
     def _get_header_string(self, headers: Dict[str, str], query: Dict[str, List[str]]) -> str:
         """Extract header string from headers or query."""
-        headers_lower = {k.lower(): v for k, v in headers.items()}
-        if self.config.commands.http_headers_header.lower() in headers_lower:
-            return headers_lower[self.config.commands.http_headers_header.lower()]
-        elif self.config.commands.http_headers_query in query:
-            return query[self.config.commands.http_headers_query][0]
-        return ""
+        value = _command_value(self._keys, headers, query)
+        return value if value is not None else ""
     
     def _parse_header_string(self, header_string: str) -> List[Tuple[str, str]]:
         """
@@ -318,82 +508,41 @@ class HeaderManager:
         """
         custom_headers = []
         try:
-            # First, try to handle the case where header names are explicitly repeated
-            # e.g., "Set-Cookie:name1=value1, Set-Cookie:name2=value2"
-            if self._has_repeated_header_names(header_string):
-                custom_headers = self._parse_with_repeated_names(header_string)
+            # Single pass: parse every "key:value" part while tracking seen
+            # names. The parsed pairs are what both the repeated-name branch
+            # and the plain comma-separated branch would produce, so the old
+            # detect-then-reparse double split collapses into one walk.
+            seen_names = set()
+            has_repeat = False
+            results = []
+            for part in header_string.split(','):
+                key, sep, value = part.partition(':')
+                if not sep:
+                    continue
+                key = key.strip()
+                name = key.lower()
+                if name in seen_names:
+                    has_repeat = True
+                else:
+                    seen_names.add(name)
+                value = value.strip()
+                if key and value:
+                    results.append((key, value))
+
+            if not has_repeat and header_string.lower().startswith('set-cookie:'):
+                # A single Set-Cookie header may carry several cookies whose
+                # values themselves contain commas; reparse with the
+                # cookie-aware splitter
+                custom_headers = self._parse_set_cookie_headers(header_string)
             else:
-                # Handle normal comma-separated header pairs
-                # e.g., "Header1:value1, Header2:value2"
-                custom_headers = self._parse_normal_headers(header_string)
-                
+                custom_headers = results
+
         except Exception:
             # Return empty list if parsing fails
             pass
-        
+
         return custom_headers
     
-    def _has_repeated_header_names(self, header_string: str) -> bool:
-        """Check if the header string contains repeated header names."""
-        # Look for pattern like "HeaderName:value, HeaderName:value"
-        header_names = []
-        parts = header_string.split(',')
-        for part in parts:
-            if ':' in part:
-                name = part.split(':', 1)[0].strip().lower()
-                if name in header_names:
-                    return True
-                header_names.append(name)
-        return False
-    
-    def _parse_with_repeated_names(self, header_string: str) -> List[Tuple[str, str]]:
-        """Parse headers when header names are explicitly repeated."""
-        headers = []
-        # Split by comma and process each header individually
-        parts = header_string.split(',')
-        
-        for part in parts:
-            part = part.strip()
-            if ':' in part:
-                key, _, value = part.partition(':')
-                key = key.strip()
-                value = value.strip()
-                if key and value:
-                    headers.append((key, value))
-        
-        return headers
-    
-    def _parse_normal_headers(self, header_string: str) -> List[Tuple[str, str]]:
-        """Parse normal header format where commas separate different headers."""
-        headers = []
-        
-        # Handle special cases for headers that commonly have comma-separated values
-        special_headers = {
-            'set-cookie',  # Each cookie should be a separate header
-            'www-authenticate',  # Multiple auth methods
-            'warning',  # Multiple warnings
-        }
-        
-        # Check if this looks like a Set-Cookie with multiple values
-        if header_string.lower().startswith('set-cookie:'):
-            # For Set-Cookie, we need to be more careful about comma splitting
-            # since cookie values might contain commas
-            return self._parse_set_cookie_headers(header_string)
-        
-        # For other headers, split by comma and treat as separate headers
-        parts = header_string.split(',')
-        
-        for part in parts:
-            part = part.strip()
-            if ':' in part:
-                key, _, value = part.partition(':')
-                key = key.strip()
-                value = value.strip()
-                if key and value:
-                    headers.append((key, value))
-        
-        return headers
-    
     def _parse_set_cookie_headers(self, header_string: str) -> List[Tuple[str, str]]:
         """
         Special parsing for Set-Cookie headers.
@@ -411,10 +560,7 @@ class HeaderManager:
         
         # Split cookies by looking for patterns like ", name=" or ", __name="
         # This is a simple heuristic - for production use, consider a proper cookie parser
-        import re
-        
-        # Split on comma followed by word characters and equals (likely start of new cookie)
-        cookie_parts = re.split(r',\s*(?=[a-zA-Z_][a-zA-Z0-9_]*=)', cookie_values)
+        cookie_parts = _COOKIE_SPLIT_RE.split(cookie_values)
         
         for cookie in cookie_parts:
             cookie = cookie.strip()
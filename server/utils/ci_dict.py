@@ -0,0 +1,67 @@
+"""
+Case-insensitive mapping for HTTP header lookups.
+"""
+
+from typing import Dict, Iterator, Optional, Tuple
+
+
+class CaseInsensitiveDict:
+    """
+    Mapping with case-insensitive keys that preserves original casing.
+
+    Entries are stored as {lowered_key: (original_key, value)}, so a
+    lookup with any casing is a single hash probe — no per-call
+    {k.lower(): v} rebuild — while iteration and serialization still see
+    the keys exactly as they were inserted.
+    """
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data=None):
+        """Initialize, optionally from a mapping or iterable of pairs."""
+        self._data: Dict[str, Tuple[str, str]] = {}
+        if data:
+            items = data.items() if hasattr(data, 'items') else data
+            for key, value in items:
+                self._data[key.lower()] = (key, value)
+
+    def __setitem__(self, key: str, value) -> None:
+        self._data[key.lower()] = (key, value)
+
+    def __getitem__(self, key: str):
+        return self._data[key.lower()][1]
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key.lower()]
+
+    def __contains__(self, key: str) -> bool:
+        return key.lower() in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[str]:
+        for original_key, _ in self._data.values():
+            yield original_key
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def get(self, key: str, default=None):
+        """Return the value for key (any casing) or default."""
+        entry = self._data.get(key.lower())
+        return entry[1] if entry is not None else default
+
+    def keys(self) -> Iterator[str]:
+        """Yield keys in their original casing."""
+        return iter(self)
+
+    def values(self) -> Iterator:
+        """Yield stored values."""
+        for _, value in self._data.values():
+            yield value
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        """Yield (original_key, value) pairs."""
+        for original_key, value in self._data.values():
+            yield original_key, value
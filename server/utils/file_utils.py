@@ -5,7 +5,20 @@ File operation utilities with security controls and error handling.
 import os
 import json
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Union
+
+# Prefer orjson for listing serialization when installed; it emits compact
+# bytes directly and is several times faster than the stdlib encoder
+try:
+    import orjson
+
+    def _dumps_compact(obj) -> bytes:
+        """Serialize obj to compact JSON bytes via orjson."""
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps_compact(obj) -> bytes:
+        """Serialize obj to compact JSON bytes via the stdlib json module."""
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
 
 
 class FileManager:
@@ -21,21 +34,25 @@ class FileManager:
             self.allowed_prefixes = allowed_prefixes
         else:
             self.allowed_prefixes = self.ALLOWED_PREFIXES.copy()
+        # str.startswith scans a tuple argument in C; kept in sync with the
+        # list by the add/remove methods
+        self._allowed_prefix_tuple = tuple(self.allowed_prefixes)
     
-    def read_file_or_directory(self, path: str) -> str:
+    def read_file_or_directory(self, path: str) -> Union[str, bytes]:
         """
         Read file content or list directory contents with security checks.
-        
+
         Args:
             path: File or directory path to read
-            
+
         Returns:
-            JSON string with content or error message
+            File content (bytes for UTF-8 files, avoiding a re-encode),
+            or compact JSON bytes with the listing or error message
         """
         try:
             # Security validation
             if not self._is_path_allowed(path):
-                return json.dumps({"error": "Access denied - path not allowed"})
+                return _dumps_compact({"error": "Access denied - path not allowed"})
             
             resolved_path = Path(path).resolve()
             
@@ -44,14 +61,14 @@ class FileManager:
             elif resolved_path.is_file():
                 return self._read_file(resolved_path)
             else:
-                return json.dumps({"error": "File or directory not found"})
+                return _dumps_compact({"error": "File or directory not found"})
                 
         except PermissionError:
-            return json.dumps({"error": "Permission denied"})
+            return _dumps_compact({"error": "Permission denied"})
         except OSError as e:
-            return json.dumps({"error": f"OS error: {str(e)}"})
+            return _dumps_compact({"error": f"OS error: {str(e)}"})
         except Exception as e:
-            return json.dumps({"error": f"Unexpected error: {str(e)}"})
+            return _dumps_compact({"error": f"Unexpected error: {str(e)}"})
     
     def _is_path_allowed(self, path: str) -> bool:
         """
@@ -69,103 +86,122 @@ class FileManager:
         
         # For absolute paths, check against allowed prefixes
         if os.path.isabs(path):
-            return any(path.startswith(prefix) for prefix in self.allowed_prefixes)
+            return path.startswith(self._allowed_prefix_tuple)
         
         # Relative paths are generally allowed but be cautious
         # You might want to restrict this further based on your security needs
         return not path.startswith('/')
     
-    def _list_directory(self, directory_path: Path) -> str:
+    def _list_directory(self, directory_path: Path) -> Union[str, bytes]:
         """
         List directory contents and return as JSON.
-        
+
         Args:
             directory_path: Path object for directory
-            
+
         Returns:
-            JSON string with sorted list of entries
+            Compact JSON bytes with sorted list of entries
         """
         try:
+            # os.scandir serves is_dir/is_file/stat from the data the single
+            # readdir call already fetched, instead of one stat(2) per check
             entries = []
-            for entry in directory_path.iterdir():
-                entry_info = {
-                    "name": entry.name,
-                    "type": "directory" if entry.is_dir() else "file"
-                }
-                
-                # Add size for files (safely)
-                if entry.is_file():
-                    try:
-                        stat = entry.stat()
-                        entry_info["size"] = stat.st_size
-                        entry_info["modified"] = stat.st_mtime
-                    except (OSError, PermissionError):
-                        # If we can't get stats, just include name and type
-                        pass
-                
-                entries.append(entry_info)
-            
-            # Sort by name
+            with os.scandir(directory_path) as scan:
+                for entry in scan:
+                    entry_info = {
+                        "name": entry.name,
+                        "type": "directory" if entry.is_dir() else "file"
+                    }
+
+                    # Add size for files (safely)
+                    if entry.is_file():
+                        try:
+                            stat = entry.stat()
+                            entry_info["size"] = stat.st_size
+                            entry_info["modified"] = stat.st_mtime
+                        except (OSError, PermissionError):
+                            # If we can't get stats, just include name and type
+                            pass
+
+                    entries.append(entry_info)
+
+
+            # Sort by name; compact output skips the pretty-printer entirely
             entries.sort(key=lambda x: x["name"].lower())
-            return json.dumps(entries, indent=2)
+            return _dumps_compact(entries)
             
         except PermissionError:
-            return json.dumps({"error": "Permission denied reading directory"})
+            return _dumps_compact({"error": "Permission denied reading directory"})
         except Exception as e:
-            return json.dumps({"error": f"Error listing directory: {str(e)}"})
+            return _dumps_compact({"error": f"Error listing directory: {str(e)}"})
     
-    def _read_file(self, file_path: Path) -> str:
+    def _read_file(self, file_path: Path) -> Union[str, bytes]:
         """
         Read file content with size and encoding checks.
-        
+
         Args:
             file_path: Path object for file
-            
+
         Returns:
-            File content as string
+            File content (bytes for UTF-8 files, str for other text encodings)
         """
         try:
             # Check file size
             file_size = file_path.stat().st_size
             if file_size > self.MAX_FILE_SIZE:
-                return json.dumps({
+                return _dumps_compact({
                     "error": f"File too large ({file_size} bytes), maximum allowed: {self.MAX_FILE_SIZE}"
                 })
-            
-            # Try to read as text with common encodings
-            encodings = ['utf-8', 'utf-16', 'iso-8859-1', 'cp1252']
-            
-            for encoding in encodings:
+
+            # Read once as bytes; valid UTF-8 content is returned as-is so the
+            # response path can send it without a decode/re-encode round trip
+            data = file_path.read_bytes()
+
+            # UTF-16 text announces itself with a BOM; handle it before the
+            # NUL sniff below, since UTF-16 is full of NUL bytes
+            if data[:2] in (b'\xff\xfe', b'\xfe\xff'):
                 try:
-                    with file_path.open('r', encoding=encoding) as f:
-                        return f.read()
+                    return data.decode('utf-16')
                 except UnicodeDecodeError:
-                    continue
-            
-            # If all text encodings fail, treat as binary and return info
-            return json.dumps({
-                "error": "Binary file detected",
-                "info": {
-                    "size": file_size,
-                    "name": file_path.name,
-                    "type": "binary"
-                }
-            })
+                    pass
+
+            # Fast binary sniff: a NUL in the first 8 KiB means no supported
+            # text encoding applies, so skip the full-buffer decode attempts
+            if b'\x00' in data[:8192]:
+                return _dumps_compact({
+                    "error": "Binary file detected",
+                    "info": {
+                        "size": file_size,
+                        "name": file_path.name,
+                        "type": "binary"
+                    }
+                })
+
+            try:
+                data.decode('utf-8')
+                return data
+            except UnicodeDecodeError:
+                pass
+
+            # latin-1 maps every byte, so this final fallback cannot fail
+            return data.decode('iso-8859-1')
             
         except PermissionError:
-            return json.dumps({"error": "Permission denied reading file"})
+            return _dumps_compact({"error": "Permission denied reading file"})
         except Exception as e:
-            return json.dumps({"error": f"Error reading file: {str(e)}"})
+            return _dumps_compact({"error": f"Error reading file: {str(e)}"})
     
     def add_allowed_prefix(self, prefix: str) -> None:
         """Add an allowed path prefix for security."""
         if prefix not in self.allowed_prefixes:
             self.allowed_prefixes.append(prefix)
-    
+            self._allowed_prefix_tuple = tuple(self.allowed_prefixes)
+
     def remove_allowed_prefix(self, prefix: str) -> None:
         """Remove an allowed path prefix."""
         if prefix in self.allowed_prefixes:
             self.allowed_prefixes.remove(prefix)
+            self._allowed_prefix_tuple = tuple(self.allowed_prefixes)
     
     def get_allowed_prefixes(self) -> List[str]:
         """Get current list of allowed path prefixes."""
@@ -5,11 +5,61 @@ Logging utilities for the Echo Server.
 import json
 import logging
 import datetime
+import queue
+import time
+from email.utils import formatdate
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict, List, Any
 from urllib.parse import ParseResult
 
 from ..config import ServerConfig, LogFormat
 
+# One drain thread per logger name; replaced (and stopped) if the logger is
+# reconfigured so repeated RequestLogger construction cannot leak threads
+_queue_listeners: Dict[str, QueueListener] = {}
+
+# Serialize structured log records with orjson when installed; logging
+# handlers need str, so the bytes are decoded once here
+try:
+    import orjson
+
+    def _dumps_log(obj: Any) -> str:
+        """Serialize a log record to a JSON string via orjson."""
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    def _dumps_log(obj: Any) -> str:
+        """Serialize a log record to a JSON string via the stdlib json module."""
+        return json.dumps(obj)
+
+# Bound once so the hot logging paths skip the module.class.method
+# attribute chain per record
+_now = datetime.datetime.now
+
+# Line-format timestamp cached at one-second granularity (its resolution):
+# (timestamp, formatted value)
+_ts_cache = (0, "")
+
+
+def _line_timestamp() -> str:
+    """Return the RFC 1123 timestamp, recomputed at most once per second."""
+    global _ts_cache
+    now = int(time.time())
+    cached_ts, cached = _ts_cache
+    if cached_ts != now:
+        cached = formatdate(now, usegmt=True)
+        _ts_cache = (now, cached)
+    return cached
+
+
+# (output key, header name) pairs included in structured logs; a fixed
+# tuple avoids rebuilding and re-filtering a dict per request
+_SAFE_LOG_HEADERS = (
+    ("host", "Host"),
+    ("contentType", "Content-Type"),
+    ("accept", "Accept"),
+    ("acceptEncoding", "Accept-Encoding"),
+)
+
 
 class RequestLogger:
     """Handles request logging with different formats."""
@@ -40,11 +90,23 @@ class RequestLogger:
             )
         
         handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        
+
+        # Hand records to a queue drained by a dedicated daemon thread, so
+        # formatting and the stream write happen off the request path; the
+        # handler on the logger itself only does a lock-free enqueue
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        previous = _queue_listeners.get(logger.name)
+        if previous is not None:
+            previous.stop()
+        listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        listener.start()
+        _queue_listeners[logger.name] = listener
+
+        logger.addHandler(QueueHandler(log_queue))
+
         # Prevent propagation to avoid duplicate logs
         logger.propagate = False
-        
+
         return logger
     
     def log_request(self, method: str, path: str, status_code: int, 
@@ -64,7 +126,12 @@ class RequestLogger:
         """
         if not self.config.features.enable_logs:
             return
-        
+
+        # Request logs all emit at INFO; skip record construction and
+        # serialization entirely when the level would drop them anyway
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         if self.config.logging.format == LogFormat.LINE:
             self._log_line_format(method, path, status_code)
         elif self.config.logging.format == LogFormat.OBJECT:
@@ -75,8 +142,7 @@ class RequestLogger:
     
     def _log_line_format(self, method: str, path: str, status_code: int) -> None:
         """Log in simple line format."""
-        timestamp = datetime.datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT')
-        message = f"{timestamp} - {method} {path} - {status_code}"
+        message = f"{_line_timestamp()} - {method} {path} - {status_code}"
         self.logger.info(message)
     
     def _log_object_format(self, method: str, path: str, status_code: int,
@@ -84,7 +150,7 @@ class RequestLogger:
                           query: Dict[str, List[str]] = None, body: str = "") -> None:
         """Log in structured JSON object format."""
         log_data = {
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp": _now().isoformat(),
             "method": method,
             "path": path,
             "status": status_code,
@@ -99,16 +165,15 @@ class RequestLogger:
         
         # Add selected headers (avoid logging sensitive information)
         if headers:
-            safe_headers = {
-                "host": headers.get('Host'),
-                "contentType": headers.get('Content-Type'),
-                "accept": headers.get('Accept'),
-                "acceptEncoding": headers.get('Accept-Encoding'),
-            }
-            # Remove None values
-            log_data["headers"] = {k: v for k, v in safe_headers.items() if v is not None}
-        
-        self.logger.info(json.dumps(log_data))
+            get = headers.get
+            safe_headers = {}
+            for out_key, header_name in _SAFE_LOG_HEADERS:
+                value = get(header_name)
+                if value is not None:
+                    safe_headers[out_key] = value
+            log_data["headers"] = safe_headers
+
+        self.logger.info(_dumps_log(log_data))
     
     def _log_default_format(self, method: str, path: str, status_code: int, 
                            client_address: str) -> None:
@@ -2,42 +2,153 @@
 Network utility functions for the Echo Server.
 """
 
+import re
 import socket
-from typing import List
+import struct
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
 from functools import lru_cache
 
+# Hostname whitelist (alphanumeric, dots, hyphens), compiled once so
+# validation is a single C-level match instead of a per-character loop
+_HOSTNAME_RE = re.compile(r'[A-Za-z0-9.\-]+\Z')
+
+# Netlink constants for the RTM_GETROUTE primary-IP lookup (Linux only)
+_RTM_GETROUTE = 26
+_NLM_F_REQUEST = 1
+_NLMSG_ERROR = 2
+_RTA_DST = 1
+_RTA_PREFSRC = 7
+
+
+def _primary_ip_via_netlink() -> Optional[str]:
+    """
+    Ask the kernel routing table for the preferred source IP (Linux).
+
+    Sends one RTM_GETROUTE message for 8.8.8.8 and reads RTA_PREFSRC from
+    the reply — no UDP socket connect and no subprocess. Returns None if
+    anything about the exchange looks unexpected.
+    """
+    dst = socket.inet_aton("8.8.8.8")
+    rtmsg = struct.pack("=BBBBBBBBI", socket.AF_INET, 32, 0, 0, 0, 0, 0, 0, 0)
+    rta = struct.pack("=HH", 4 + len(dst), _RTA_DST) + dst
+    payload = rtmsg + rta
+    header = struct.pack(
+        "=IHHII", 16 + len(payload), _RTM_GETROUTE, _NLM_F_REQUEST, 1, 0
+    )
+
+    with socket.socket(socket.AF_NETLINK, socket.SOCK_RAW,
+                       socket.NETLINK_ROUTE) as sock:
+        sock.settimeout(1.0)
+        sock.send(header + payload)
+        response = sock.recv(4096)
+
+    msg_len, msg_type, _, _, _ = struct.unpack_from("=IHHII", response)
+    if msg_type == _NLMSG_ERROR or msg_len > len(response):
+        return None
+
+    # Walk the route attributes that follow the fixed-size rtmsg
+    offset = 16 + 12
+    while offset + 4 <= msg_len:
+        rta_len, rta_type = struct.unpack_from("=HH", response, offset)
+        if rta_len < 4:
+            break
+        if rta_type == _RTA_PREFSRC and rta_len >= 8:
+            return socket.inet_ntoa(response[offset + 4:offset + 8])
+        offset += (rta_len + 3) & ~3
+
+    return None
+
+
+@lru_cache(maxsize=1)
+def _get_hostname() -> str:
+    """Resolve the hostname once per process; shared across instances."""
+    try:
+        return socket.gethostname()
+    except Exception:
+        return "unknown"
+
 
 class NetworkUtils:
     """Utilities for network operations and information gathering."""
     
-    def __init__(self):
-        """Initialize NetworkUtils."""
-        pass
-    
-    @lru_cache(maxsize=1)
+    def __init__(self, cache_ttl_seconds: float = 60.0):
+        """
+        Initialize NetworkUtils.
+
+        Args:
+            cache_ttl_seconds: How long resolved IP info is reused before
+                being refreshed (the primary IP can change on long-running
+                hosts, so an unbounded cache would go stale)
+        """
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._ttl_cache: Dict[str, Tuple[Any, float]] = {}
+        # Guards the miss path only; hits read the dict without locking
+        self._miss_lock = threading.Lock()
+        # Resolve in the background so the first request hits warm caches
+        # instead of paying the DNS/routing lookups on the response path
+        threading.Thread(target=self._warm_caches, daemon=True).start()
+
+    def _warm_caches(self) -> None:
+        """Populate the hostname and IP caches ahead of the first request."""
+        self.get_hostname()
+        self.get_primary_ip()
+        self.get_all_ips()
+
+    def _cached_with_ttl(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key, recomputing once it expires."""
+        # Lock-free fast path: dict reads are atomic under the GIL, so a
+        # warm hit never contends with other handler threads
+        entry = self._ttl_cache.get(key)
+        now = time.monotonic()
+        if entry is not None and now < entry[1]:
+            return entry[0]
+        # Serialize the miss path so concurrent expiries do not all issue
+        # the same DNS/routing lookup; the re-check catches the thread
+        # that lost the race to a fresh value
+        with self._miss_lock:
+            entry = self._ttl_cache.get(key)
+            now = time.monotonic()
+            if entry is not None and now < entry[1]:
+                return entry[0]
+            value = compute()
+            self._ttl_cache[key] = (value, now + self.cache_ttl_seconds)
+        return value
+
+
     def get_hostname(self) -> str:
         """
         Get the server's hostname with caching.
-        
+
         Returns:
             Hostname as string
         """
-        try:
-            return socket.gethostname()
-        except Exception:
-            return "unknown"
+        return _get_hostname()
     
-    @lru_cache(maxsize=1)
     def get_primary_ip(self) -> str:
         """
-        Get the server's primary IP address with caching.
-        
+        Get the server's primary IP address with TTL caching.
+
         Uses connection to a remote server to determine the local IP
         that would be used for outbound connections.
-        
+
         Returns:
             Primary IP address as string
         """
+        return self._cached_with_ttl('primary_ip', self._resolve_primary_ip)
+
+    def _resolve_primary_ip(self) -> str:
+        """Determine the primary IP, preferring a direct routing query."""
+        # Linux fast path: one netlink message against the routing table
+        if hasattr(socket, 'AF_NETLINK'):
+            try:
+                ip = _primary_ip_via_netlink()
+                if ip:
+                    return ip
+            except Exception:
+                pass
+
         try:
             # Create a socket and connect to a remote address
             # This doesn't actually send data, just determines routing
@@ -48,36 +159,38 @@ class NetworkUtils:
         except Exception:
             return "127.0.0.1"
     
-    @lru_cache(maxsize=1)
-    def get_all_ips(self) -> List[str]:
+    def get_all_ips(self) -> Tuple[str, ...]:
         """
-        Get all IP addresses associated with the hostname with caching.
-        
+        Get all IP addresses associated with the hostname with TTL caching.
+
         Returns:
-            List of IP addresses
+            Tuple of IP addresses; immutable, so the cached value is safe
+            to hand out without copying
         """
+        return self._cached_with_ttl('all_ips', self._resolve_all_ips)
+
+    def _resolve_all_ips(self) -> Tuple[str, ...]:
+        """Resolve every address attached to the hostname."""
         try:
             hostname = self.get_hostname()
-            # Get all addresses associated with hostname
-            _, _, ip_list = socket.gethostbyname_ex(hostname)
-            
-            # Always include localhost
-            ips = ["127.0.0.1"]
-            
-            # Add other IPs if they're not already included
-            for ip in ip_list:
-                if ip not in ips:
-                    ips.append(ip)
-            
-            return ips
+            # One getaddrinfo call returns both IPv4 and IPv6 addresses,
+            # replacing the IPv4-only gethostbyname_ex second round-trip
+            infos = socket.getaddrinfo(hostname, None, type=socket.SOCK_STREAM)
+
+            # Always include localhost; dict keys dedupe in O(1) per address
+            # while preserving insertion order
+            ips = dict.fromkeys(["127.0.0.1"])
+            for info in infos:
+                ips[info[4][0]] = None
+
+            return tuple(ips)
         except Exception:
-            return ["127.0.0.1"]
+            return ("127.0.0.1",)
     
     def clear_cache(self) -> None:
         """Clear the cached network information."""
-        self.get_hostname.cache_clear()
-        self.get_primary_ip.cache_clear()
-        self.get_all_ips.cache_clear()
+        _get_hostname.cache_clear()
+        self._ttl_cache.clear()
     
     @staticmethod
     def is_valid_port(port: int) -> bool:
@@ -105,29 +218,47 @@ class NetworkUtils:
         """
         if not host or not host.strip():
             return False
-        
-        # Try to parse as IP address
-        try:
-            socket.inet_aton(host)
-            return True
-        except socket.error:
-            pass
-        
+
+        # Try to parse as IPv4. Dotted-quad literals start with a digit, so
+        # the prefilter keeps ordinary hostnames off the exception
+        # setup/teardown path. inet_pton is stricter than inet_aton — it
+        # rejects legacy shorthand like '0x7f.1' — and skips its slower
+        # legacy parsing.
+        if host[0].isdigit():
+            try:
+                socket.inet_pton(socket.AF_INET, host)
+                return True
+            except OSError:
+                pass
+
+        # Colons never appear in hostnames, so this only runs for IPv6
+        # candidates (and rejects anything else containing a colon)
+        if ':' in host:
+            try:
+                socket.inet_pton(socket.AF_INET6, host)
+                return True
+            except OSError:
+                return False
+
         # Check as hostname (basic validation)
         if len(host) > 253:
             return False
-        
+
         # Allow alphanumeric, dots, and hyphens
-        allowed_chars = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-')
-        return all(c in allowed_chars for c in host)
+        return _HOSTNAME_RE.match(host) is not None
     
     def get_network_info(self) -> dict:
         """
-        Get comprehensive network information.
-        
+        Get comprehensive network information with TTL caching.
+
         Returns:
             Dictionary with network information
         """
+        # Copy so callers mutating the result cannot poison the cache
+        return dict(self._cached_with_ttl('network_info', self._build_network_info))
+
+    def _build_network_info(self) -> dict:
+        """Assemble the network info dictionary from the individual lookups."""
         return {
             "hostname": self.get_hostname(),
             "primary_ip": self.get_primary_ip(),
@@ -2,6 +2,8 @@
 Timing utilities for request delays and validation.
 """
 
+import asyncio
+import sys
 import time
 from typing import Dict, List, Union
 
@@ -14,7 +16,16 @@ class TimingManager:
     def __init__(self, config: ServerConfig):
         """Initialize with configuration."""
         self.config = config
-    
+        # Lowered once here instead of on every request; interned so dict
+        # probes can hit pointer equality
+        self._time_header_lc = sys.intern(config.commands.time_header.lower())
+        self._time_query = sys.intern(config.commands.time_query)
+        # Clamp bounds copied to plain attributes, sparing the nested
+        # config lookups on every delay validation
+        self._min_ms = int(config.timing.min_delay_ms)
+        self._max_ms = int(config.timing.max_delay_ms)
+
+
     def get_delay_ms(self, headers: Dict[str, str], query: Dict[str, List[str]]) -> int:
         """
         Extract and validate delay from headers or query parameters.
@@ -39,19 +50,42 @@ class TimingManager:
         """
         delay_ms = self.get_delay_ms(headers, query)
         if delay_ms > 0:
-            time.sleep(delay_ms / 1000.0)
-    
+            time.sleep(delay_ms * 0.001)
+
+    async def apply_delay_async(self, headers: Dict[str, str],
+                                query: Dict[str, List[str]]) -> None:
+        """
+        Apply delay if requested, yielding the event loop while waiting.
+
+        Unlike apply_delay, this does not pin a thread for the duration, so
+        many delayed requests can wait concurrently on the ASGI path.
+
+        Args:
+            headers: Request headers
+            query: Query parameters
+        """
+        delay_ms = self.get_delay_ms(headers, query)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms * 0.001)
+
+
     def _extract_delay_string(self, headers: Dict[str, str], query: Dict[str, List[str]]) -> str:
         """Extract delay string from headers or query parameters."""
-        # Check headers first (higher priority) - case insensitive
-        headers_lower = {k.lower(): v for k, v in headers.items()}
-        if self.config.commands.time_header.lower() in headers_lower:
-            return headers_lower[self.config.commands.time_header.lower()]
-        
+        # Check headers first (higher priority) - case insensitive. A direct
+        # get() covers pre-lowered mappings and email.Message views; a single
+        # scan replaces the old per-call {k.lower(): v} rebuild otherwise.
+        value = headers.get(self._time_header_lc)
+        if value is not None:
+            return value
+        for name, val in headers.items():
+            if name.lower() == self._time_header_lc:
+                return val
+
         # Check query parameters
-        if self.config.commands.time_query in query:
-            return query[self.config.commands.time_query][0]
-        
+        values = query.get(self._time_query)
+        if values:
+            return values[0]
+
         return "0"
     
     def _validate_delay(self, delay_str: str) -> int:
@@ -64,18 +98,22 @@ class TimingManager:
         Returns:
             Validated delay in milliseconds
         """
-        try:
+        # The common well-formed value ("5000") passes isdigit and skips
+        # the exception machinery entirely
+        if isinstance(delay_str, str) and delay_str.isdigit():
             delay_ms = int(delay_str)
-        except (ValueError, TypeError):
-            return 0
-        
-        # Apply configured limits
-        if delay_ms < self.config.timing.min_delay_ms:
-            return self.config.timing.min_delay_ms
-        elif delay_ms > self.config.timing.max_delay_ms:
-            return self.config.timing.max_delay_ms
-        
-        return delay_ms
+        else:
+            try:
+                delay_ms = int(delay_str)
+            except (ValueError, TypeError):
+                return 0
+
+        # Apply configured limits as a single clamp expression
+        min_ms = self._min_ms
+        max_ms = self._max_ms
+        return min_ms if delay_ms < min_ms else (
+            max_ms if delay_ms > max_ms else delay_ms
+        )
     
     def is_delay_within_limits(self, delay_ms: int) -> bool:
         """
@@ -87,18 +125,17 @@ class TimingManager:
         Returns:
             True if within limits, False otherwise
         """
-        return (self.config.timing.min_delay_ms <= delay_ms <= 
-                self.config.timing.max_delay_ms)
-    
+        return self._min_ms <= delay_ms <= self._max_ms
+
     def get_timing_info(self) -> Dict[str, Union[int, bool]]:
         """
         Get timing configuration information.
-        
+
         Returns:
             Dictionary with timing configuration
         """
         return {
-            "min_delay_ms": self.config.timing.min_delay_ms,
-            "max_delay_ms": self.config.timing.max_delay_ms,
+            "min_delay_ms": self._min_ms,
+            "max_delay_ms": self._max_ms,
             "timing_enabled": True,
         }